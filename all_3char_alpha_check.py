@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 # All 3-Character Alphabetic Domain Checker
 # Checks all possible 3-letter combinations (a-z only) for .com domain availability
-# Runs in alphabetical order from aaa.com to zzz.com (or custom start/end) with multi-threading
+# (other name lengths can be swept with --width)
+# Runs in alphabetical order from aaa.com to zzz.com (or custom start/end) with concurrent asyncio lookups
 # Saves results to a text file and available domains to a separate file
 
 import string
@@ -9,143 +10,303 @@ import sys
 import time
 import datetime
 import os
+import sqlite3
 import argparse
+import itertools
 import threading
-import concurrent.futures
-from domaintest import check_domain
-from colorama import Fore, Style, init
+import queue
+import asyncio
+from domaintest import check_domain_async, create_http_session, parse_registrar_details, run_async
+from domaintest import GREEN, RED, YELLOW, CYAN, RESET
+from random_3char_domain_check import positive_int
 
-# Initialize colorama
-init(autoreset=True)
-
-# Thread-safe counters and locks
+# Progress counters; only the event loop thread writes them (the reporter
+# thread just reads), so they need no lock
 available_count = 0
 checked_count = 0
-counter_lock = threading.Lock()
-log_lock = threading.Lock()
-available_lock = threading.Lock()
 
-def generate_3char_combinations(start_domain="aaa", end_domain="zzz"):
-    """Generate 3-letter combinations from start_domain to end_domain (a-z only)"""
-    letters = string.ascii_lowercase  # a-z
-    
-    # Validate input domains
-    start_domain = start_domain.lower()[:3]
-    end_domain = end_domain.lower()[:3]
+# Seconds between progress updates printed by the reporter thread
+PROGRESS_INTERVAL = 2
+
+# Log lines are handed to a single writer thread through a bounded queue as
+# preformatted bytes; the writer keeps one buffer per file and issues one
+# os.write per file every LOG_FLUSH_INTERVAL seconds, or sooner at 64 KiB
+LOG_QUEUE_SIZE = 4096
+LOG_BATCH_SIZE = 128
+LOG_BUFFER_SIZE = 1 << 16
+LOG_FLUSH_INTERVAL = 0.1
+LOG_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND
+
+# Every result is also recorded in a SQLite database in the output directory,
+# committed in batches, so an interrupted sweep can be resumed with --resume
+RESULTS_DB_NAME = "results.db"
+DB_BATCH_SIZE = 500
+
+def _combination_index(name):
+    """Position of a name in the a..z ordering of names of its length (base 26, a=0)"""
+    index = 0
+    for c in name:
+        index = index * 26 + (ord(c) - 97)
+    return index
+
+class _NameRange:
+    """
+    Lazy, alphabetically ordered range of fixed-width a-z names.
+    Names are computed from their position on demand, so 4-5 letter ranges
+    (457K / 11.9M names) are never held in memory as a list.
+    """
     
-    # Pad with 'a's if too short
-    while len(start_domain) < 3:
-        start_domain += 'a'
-    while len(end_domain) < 3:
-        end_domain += 'z'
+    def __init__(self, start_index, end_index, width):
+        self._indexes = range(start_index, end_index + 1)
+        self._width = width
     
-    # Replace any non-a-z characters with 'a' for start or 'z' for end
-    start_chars = []
-    end_chars = []
+    def __len__(self):
+        return len(self._indexes)
     
-    for char in start_domain:
-        if char not in letters:
-            start_chars.append('a')
-        else:
-            start_chars.append(char)
-            
-    for char in end_domain:
-        if char not in letters:
-            end_chars.append('z')
-        else:
-            end_chars.append(char)
+    def __contains__(self, name):
+        return (len(name) == self._width and name.isascii() and name.isalpha() and name.islower()
+                and _combination_index(name) in self._indexes)
     
-    start_domain = ''.join(start_chars)
-    end_domain = ''.join(end_chars)
+    def _name_at(self, index):
+        letters = string.ascii_lowercase
+        chars = []
+        for _ in range(self._width):
+            index, digit = divmod(index, 26)
+            chars.append(letters[digit])
+        return ''.join(reversed(chars))
     
-    # Generate combinations in alphabetical order
-    combinations = []
+    def __iter__(self):
+        return map(self._name_at, self._indexes)
+
+def generate_combinations(start_domain="aaa", end_domain="zzz", width=3):
+    """
+    Generate width-letter combinations from start_domain to end_domain (a-z only).
+    Up to 3 letters this is a list; wider ranges come back as a lazy _NameRange.
+    """
+    letters = string.ascii_lowercase  # a-z
+    first, last = 'a' * width, 'z' * width
     
-    # Convert domains to numeric values (a=0, b=1, ..., z=25)
-    start_values = [letters.index(c) for c in start_domain]
-    end_values = [letters.index(c) for c in end_domain]
+    # Truncate to width characters, replace any non-a-z characters and pad
+    # with 'a' for start or 'z' for end
+    start_domain = ''.join(c if c in letters else 'a' for c in start_domain.lower()[:width]).ljust(width, 'a')
+    end_domain = ''.join(c if c in letters else 'z' for c in end_domain.lower()[:width]).ljust(width, 'z')
     
     # Check if start comes after end in alphabet
     if start_domain > end_domain:
-        print(f"{Fore.RED}Error: Start domain '{start_domain}' comes after end domain '{end_domain}' alphabetically.{Style.RESET_ALL}")
-        print(f"Defaulting to full range (aaa-zzz).")
-        start_domain = "aaa"
-        end_domain = "zzz"
-        start_values = [0, 0, 0]  # aaa
-        end_values = [25, 25, 25]  # zzz
-    
-    # Generate all combinations from start to end
-    current = start_values.copy()
+        print(f"{RED}Error: Start domain '{start_domain}' comes after end domain '{end_domain}' alphabetically.{RESET}")
+        print(f"Defaulting to full range ({first}-{last}).")
+        start_domain = first
+        end_domain = last
     
-    while True:
-        # Convert current numeric values to a domain string
-        domain = ''.join(letters[i] for i in current)
-        combinations.append(domain)
-        
-        # Check if we've reached the end domain
-        if domain == end_domain:
-            break
-            
-        # Increment the current value (like counting)
-        current[2] += 1  # Increment the rightmost character
-        
-        # Handle carrying over to next position
-        for i in range(2, 0, -1):
-            if current[i] > 25:  # If we've gone past 'z'
-                current[i] = 0   # Reset to 'a'
-                current[i-1] += 1  # Increment the next position left
+    start_index = _combination_index(start_domain)
+    end_index = _combination_index(end_domain)
+    if width >= 4:
+        return _NameRange(start_index, end_index, width)
     
-    return combinations
+    # itertools.product yields every combination in alphabetical order, so the
+    # requested range is a plain slice between the two positions
+    combinations = list(map(''.join, itertools.product(letters, repeat=width)))
+    return combinations[start_index:end_index + 1]
 
-def check_single_domain(base, all_log_file, available_log_file, total):
-    """Check a single domain and update the appropriate log files"""
-    global available_count, checked_count
-    
-    domain = f"{base}.com"
-    
-    # Check domain availability
-    result = check_domain(domain)
+def generate_3char_combinations(start_domain="aaa", end_domain="zzz"):
+    """Generate 3-letter combinations from start_domain to end_domain (a-z only)"""
+    return generate_combinations(start_domain, end_domain, 3)
+
+def _make_checker(tld, log_queue, total, session, trust_registry=False):
+    """
+    Build the check coroutine for one sweep. The TLD and the run's shared objects are
+    bound once here as closure variables instead of being passed along for every domain.
+    """
+    suffix = f".{tld}"
+    put = log_queue.put
+    check = check_domain_async
+    parse = parse_registrar_details
     
-    # Update counters with thread safety
-    with counter_lock:
+    async def check_single_domain(base):
+        """Check a single domain and queue its log lines for the writer thread"""
+        global available_count, checked_count
+        
+        domain = base + suffix
+        
+        # Check domain availability
+        try:
+            # Sweeps keep their own results.db (see --resume), so bypass the per-user result cache
+            result = await check(domain, session, trust_registry=trust_registry, use_cache=False)
+        except Exception as e:
+            print(f"\n{RED}Error checking {domain}: {str(e)}{RESET}")
+            return False
+        
         checked_count += 1
         current_checked = checked_count
+        
+        if result.available:
+            available_count += 1
+            line = f"{domain},AVAILABLE\n".encode()
+            # Also save to available domains file
+            put((line, line, (domain, 1, None, None)))
+            
+            # Print available domains to console
+            print(f"\n{GREEN}✅ Found available: {domain} ({current_checked}/{total}){RESET}")
+        else:
+            # For taken domains, extract registrar and expiry if available
+            registrar, expiry = parse(result.details)
+            put((f"{domain},TAKEN,{registrar},{expiry}\n".encode(), None, (domain, 0, registrar, expiry)))
+        
+        return result.available
     
-    # Save to log files with thread safety
-    with log_lock:
-        with open(all_log_file, 'a') as f:
-            if result["available"]:
-                with counter_lock:
-                    available_count += 1
-                f.write(f"{domain},AVAILABLE\n")
-                
-                # Also save to available domains file
-                with available_lock:
-                    with open(available_log_file, 'a') as avail_f:
-                        avail_f.write(f"{domain},AVAILABLE\n")
-                
-                # Print available domains to console
-                print(f"\n{Fore.GREEN}✅ Found available: {domain} ({current_checked}/{total}){Style.RESET_ALL}")
-            else:
-                # For taken domains, extract registrar and expiry if available
-                registrar = "Unknown"
-                expiry = "Unknown"
-                
-                if "Registrar:" in result.get("details", ""):
-                    detail_parts = result.get("details", "").split("Registrar:", 1)[1].strip()
-                    if "Expires:" in detail_parts:
-                        registrar_part, expiry_part = detail_parts.split("(Expires:", 1)
-                        registrar = registrar_part.strip()
-                        expiry = expiry_part.replace(")", "").strip()
-                    else:
-                        registrar = detail_parts
-                
-                f.write(f"{domain},TAKEN,{registrar},{expiry}\n")
+    return check_single_domain
+
+def open_results_db(output_dir):
+    """Open (creating if needed) the sweep's results database in WAL mode"""
+    # The connection is handed to the writer thread, but only one thread uses it at a time
+    db = sqlite3.connect(os.path.join(output_dir, RESULTS_DB_NAME), isolation_level=None, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("CREATE TABLE IF NOT EXISTS checked ("
+               "domain TEXT PRIMARY KEY, status INTEGER, registrar TEXT, expiry TEXT, checked_at TEXT)")
+    return db
+
+def _save_rows(db, rows):
+    """Upsert (domain, status, registrar, expiry) rows in a single transaction"""
+    checked_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    try:
+        db.execute("BEGIN IMMEDIATE")
+        db.executemany("INSERT OR REPLACE INTO checked VALUES (?, ?, ?, ?, ?)",
+                       [row + (checked_at,) for row in rows])
+        db.execute("COMMIT")
+    except sqlite3.Error:
+        if db.in_transaction:
+            db.execute("ROLLBACK")
+        raise
+
+def _write_all(fd, data):
+    """os.write until every byte of data is written"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _open_log(path):
+    """Open a log file for appending as a raw descriptor"""
+    return os.open(path, LOG_FILE_FLAGS, 0o644)
+
+def _log_writer(log_queue, all_fd, available_fd, db):
+    """Drain queued (all_line, available_line, db_row) entries in batches until a None sentinel arrives"""
+    stop_seen = threading.Event()
+    try:
+        _write_logs(log_queue, all_fd, available_fd, db, stop_seen)
+    except Exception as e:
+        # Keep consuming so the sweep never blocks on a full queue, just without logging.
+        # If the sentinel was already taken (the final flush failed) there is nothing left to wait for
+        sys.stderr.write(f"\n{RED}Log writer failed, results are no longer being saved: {e}{RESET}\n")
+        if not stop_seen.is_set():
+            while log_queue.get() is not None:
+                pass
+
+def _write_logs(log_queue, all_fd, available_fd, db, stop_seen):
+    """Body of _log_writer: buffer entries and flush them to both files and the database, setting stop_seen once the sentinel is taken"""
+    db_failures = 0
+    all_buf = bytearray()
+    available_buf = bytearray()
+    pending_rows = []
+    next_flush = time.monotonic() + LOG_FLUSH_INTERVAL
+    while True:
+        # Wake up at least once per flush tick even when no results arrive
+        try:
+            entries = [log_queue.get(timeout=max(next_flush - time.monotonic(), 0))]
+        except queue.Empty:
+            entries = []
+        while len(entries) < LOG_BATCH_SIZE and not log_queue.empty():
+            entries.append(log_queue.get_nowait())
+        
+        stop = None in entries
+        if stop:
+            stop_seen.set()
+        entries = [entry for entry in entries if entry is not None]
+        for entry in entries:
+            all_buf += entry[0]
+            if entry[1] is not None:
+                available_buf += entry[1]
+        pending_rows.extend(entry[2] for entry in entries)
+        
+        tick = time.monotonic() >= next_flush
+        if all_buf and (tick or stop or len(all_buf) >= LOG_BUFFER_SIZE):
+            _write_all(all_fd, all_buf)
+            all_buf.clear()
+        # Finds are rare and valuable: they go out on the next tick at the latest,
+        # together with their database rows
+        found = bool(available_buf) and (tick or stop or len(available_buf) >= LOG_BUFFER_SIZE)
+        if found:
+            _write_all(available_fd, available_buf)
+            available_buf.clear()
+        if pending_rows and (len(pending_rows) >= DB_BATCH_SIZE or found or stop):
+            try:
+                _save_rows(db, pending_rows)
+            except sqlite3.Error as e:
+                # e.g. "database is locked" by another sweep on the same output dir. The
+                # text logs still get these results; --resume will just check them again
+                db_failures += 1
+                if db_failures == 1:
+                    sys.stderr.write(f"\n{RED}Could not save results to {RESULTS_DB_NAME}: {e}{RESET}\n")
+            pending_rows = []
+        if tick:
+            next_flush = time.monotonic() + LOG_FLUSH_INTERVAL
+        
+        if stop:
+            if db_failures:
+                sys.stderr.write(f"{YELLOW}{db_failures} batch(es) of results were not saved to {RESULTS_DB_NAME}{RESET}\n")
+            return
+
+def _progress_reporter(stop_event, total, max_workers, start_time):
+    """Print a progress line every PROGRESS_INTERVAL seconds until stop_event is set"""
+    while not stop_event.wait(PROGRESS_INTERVAL):
+        # Plain int reads; a momentarily stale pair is fine for a progress line
+        local_checked = checked_count
+        local_available = available_count
+        
+        elapsed = time.time() - start_time
+        domains_per_second = local_checked / elapsed if elapsed > 0 else 0
+        percent_complete = (local_checked / total) * 100 if total else 100.0
+        
+        # Estimate time remaining
+        if domains_per_second > 0:
+            remaining_domains = total - local_checked
+            seconds_remaining = remaining_domains / domains_per_second
+            time_remaining = str(datetime.timedelta(seconds=int(seconds_remaining)))
+        else:
+            time_remaining = "unknown"
+        
+        sys.stdout.write(f"\r{YELLOW}Progress: {local_checked}/{total} ({percent_complete:.1f}%) | "
+                         f"Concurrency: {max_workers} | "
+                         f"Found: {local_available} available | "
+                         f"Speed: {domains_per_second:.2f} domains/sec | "
+                         f"Est. remaining: {time_remaining}{RESET}")
+        sys.stdout.flush()
+
+async def _run_checks(names, total, log_queue, max_workers, trust_registry):
+    """Run the checks for total names from the names iterable on the event loop with max_workers worker coroutines"""
+    names = iter(names)
     
-    return result["available"]
+    # One HTTP connection pool is shared by every double-check probe of the run
+    async with create_http_session(limit=max_workers) as session:
+        check_single_domain = _make_checker("com", log_queue, total, session, trust_registry)
+        
+        async def worker():
+            # Workers pull from one shared iterator, so each name is checked exactly once
+            # and only max_workers coroutines exist however large the range is
+            for base in names:
+                await check_single_domain(base)
+        
+        await asyncio.gather(*(worker() for _ in range(min(max_workers, total))))
 
-def check_domains_multithreaded(start_domain="aaa", end_domain="zzz", output_dir="domain_results", max_workers=10):
-    """Check 3-letter .com domains in parallel using multiple threads"""
+def check_domains_multithreaded(start_domain="aaa", end_domain="zzz", output_dir="domain_results", max_workers=200,
+                                resume=False, trust_registry=False, width=3, skip_unexpired=False):
+    """
+    Check width-letter (3 by default) .com domains concurrently, with up to max_workers WHOIS lookups in flight.
+    With resume=True, domains already recorded in the output directory's results database are skipped.
+    With skip_unexpired=True, domains the database records as taken with an expiry date still
+    in the future are skipped too, since they cannot have been released since.
+    With trust_registry=True, Verisign's "No match for" answer is final and no DNS/HTTP double check is made.
+    """
     # Create output directory if it doesn't exist
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
@@ -155,32 +316,61 @@ def check_domains_multithreaded(start_domain="aaa", end_domain="zzz", output_dir
     all_domains_file = os.path.join(output_dir, f"all_domains_{timestamp}.txt")
     available_domains_file = os.path.join(output_dir, f"available_domains_{timestamp}.txt")
     
-    combinations = generate_3char_combinations(start_domain, end_domain)
-    total = len(combinations)
+    combinations = generate_combinations(start_domain, end_domain, width)
     
-    print(f"{Fore.CYAN}===== Multi-Threaded 3-Letter .COM Domain Availability Checker ====={Style.RESET_ALL}")
+    db = open_results_db(output_dir)
+    skip = set()
+    if resume:
+        skip.update(row[0] for row in db.execute("SELECT domain FROM checked"))
+    if skip_unexpired:
+        skip.update(row[0] for row in db.execute(
+            "SELECT domain FROM checked WHERE status = 0 AND expiry GLOB '[0-9][0-9][0-9][0-9]-*' AND expiry > ?",
+            (datetime.date.today().isoformat(),)))
+    skipped = 0
+    names = combinations
+    if skip:
+        # Filter lazily: wide ranges would not fit in memory as a list of survivors.
+        # Instead count how many skipped domains fall inside the range
+        in_range = combinations if isinstance(combinations, _NameRange) else set(combinations)
+        skipped = sum(1 for domain in skip if domain.endswith(".com") and domain[:-len(".com")] in in_range)
+        names = (base for base in combinations if f"{base}.com" not in skip)
+    total = len(combinations) - skipped
+    
+    print(f"{CYAN}===== Concurrent {width}-Letter .COM Domain Availability Checker ====={RESET}")
     print(f"Checking domains alphabetically from {start_domain}.com to {end_domain}.com")
     print(f"Total domains to check: {total}")
-    print(f"{Fore.YELLOW}Using up to {max_workers} threads for parallel processing{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}Results will be saved to: {Style.RESET_ALL}")
+    if resume or skip_unexpired:
+        print(f"Skipping {skipped} domains based on {RESULTS_DB_NAME}")
+    print(f"{YELLOW}Using up to {max_workers} concurrent lookups{RESET}")
+    print(f"{YELLOW}Results will be saved to: {RESET}")
     print(f"  - All domains: {all_domains_file}")
     print(f"  - Available domains: {available_domains_file}")
-    print(f"{Fore.YELLOW}You can press Ctrl+C at any time to stop the process.{Style.RESET_ALL}")
+    print(f"  - Results database: {os.path.join(output_dir, RESULTS_DB_NAME)}")
+    print(f"{YELLOW}You can press Ctrl+C at any time to stop the process.{RESET}")
     print("-" * 70)
     
-    # Initialize the output files
-    with open(all_domains_file, 'w') as f:
-        f.write(f"# 3-Letter Domain Availability Check\n")
-        f.write(f"# Range: {start_domain}.com to {end_domain}.com\n")
-        f.write(f"# Started: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"# Threads: {max_workers}\n")
-        f.write(f"# Format: domain,status,registrar,expiry_date\n\n")
+    # Initialize the output files, kept open (as raw descriptors) for the whole run
+    all_fd = _open_log(all_domains_file)
+    _write_all(all_fd, (
+        f"# {width}-Letter Domain Availability Check\n"
+        f"# Range: {start_domain}.com to {end_domain}.com\n"
+        f"# Started: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"# Concurrency: {max_workers}\n"
+        f"# Format: domain,status,registrar,expiry_date\n\n"
+    ).encode())
+    
+    available_fd = _open_log(available_domains_file)
+    _write_all(available_fd, (
+        f"# Available {width}-Letter Domains\n"
+        f"# Range: {start_domain}.com to {end_domain}.com\n"
+        f"# Started: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"# Format: domain,status\n\n"
+    ).encode())
     
-    with open(available_domains_file, 'w') as f:
-        f.write(f"# Available 3-Letter Domains\n")
-        f.write(f"# Range: {start_domain}.com to {end_domain}.com\n")
-        f.write(f"# Started: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"# Format: domain,status\n\n")
+    # Start the background writer that owns both files and the database
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    writer = threading.Thread(target=_log_writer, args=(log_queue, all_fd, available_fd, db), daemon=True)
+    writer.start()
     
     # Reset global counters
     global available_count, checked_count
@@ -188,82 +378,59 @@ def check_domains_multithreaded(start_domain="aaa", end_domain="zzz", output_dir
     checked_count = 0
     
     start_time = time.time()
-    last_update_time = start_time
+    
+    # Progress is printed from its own thread so the event loop only runs checks
+    stop_progress = threading.Event()
+    reporter = threading.Thread(target=_progress_reporter, args=(stop_progress, total, max_workers, start_time), daemon=True)
+    reporter.start()
     
     try:
-        # Create and configure the thread pool
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all domain checks to the executor
-            futures = {executor.submit(check_single_domain, base, all_domains_file, available_domains_file, total): base 
-                       for base in combinations}
-            
-            # Process domains as they complete
-            for future in concurrent.futures.as_completed(futures):
-                # Periodically update the progress display
-                current_time = time.time()
-                if current_time - last_update_time >= 2:  # Update every 2 seconds
-                    with counter_lock:
-                        local_checked = checked_count
-                        local_available = available_count
-                    
-                    elapsed = current_time - start_time
-                    domains_per_second = local_checked / elapsed if elapsed > 0 else 0
-                    percent_complete = (local_checked / total) * 100
-                    
-                    # Estimate time remaining
-                    if domains_per_second > 0:
-                        remaining_domains = total - local_checked
-                        seconds_remaining = remaining_domains / domains_per_second
-                        time_remaining = str(datetime.timedelta(seconds=int(seconds_remaining)))
-                    else:
-                        time_remaining = "unknown"
-                    
-                    print(f"\r{Fore.YELLOW}Progress: {local_checked}/{total} ({percent_complete:.1f}%) | "
-                          f"Threads: {max_workers} | "
-                          f"Found: {local_available} available | "
-                          f"Speed: {domains_per_second:.2f} domains/sec | "
-                          f"Est. remaining: {time_remaining}{Style.RESET_ALL}", end="")
-                    
-                    last_update_time = current_time
-                
-                # Catch any exceptions from the workers
-                try:
-                    future.result()  # Will raise any exceptions from the worker thread
-                except Exception as e:
-                    print(f"\n{Fore.RED}Error checking domain: {str(e)}{Style.RESET_ALL}")
+        run_async(_run_checks(names, total, log_queue, max_workers, trust_registry))
     
     except KeyboardInterrupt:
-        print(f"\n\n{Fore.YELLOW}Process interrupted by user after checking {checked_count} domains.{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}You can resume by running with these parameters:{Style.RESET_ALL}")
+        print(f"\n\n{YELLOW}Process interrupted by user after checking {checked_count} domains.{RESET}")
+        print(f"{YELLOW}You can resume by running with these parameters:{RESET}")
         
-        # Figure out approximately where we stopped
+        # Every finished check is in the results database, so resuming skips exactly those
         if checked_count < total:
-            # Estimate the next domain based on completion percentage
-            completion_ratio = checked_count / total
-            next_idx = min(int(len(combinations) * completion_ratio), len(combinations) - 1)
-            next_domain = combinations[next_idx]
-            print(f"{Fore.YELLOW}python {sys.argv[0]} --start {next_domain} --end {end_domain} --threads {max_workers}{Style.RESET_ALL}")
+            print(f"{YELLOW}python {sys.argv[0]} --start {start_domain} --end {end_domain} --concurrency {max_workers} "
+                  f"--output-dir {output_dir} --width {width} --resume"
+                  f"{' --trust-registry' if trust_registry else ''}{' --skip-unexpired' if skip_unexpired else ''}{RESET}")
         
     finally:
+        stop_progress.set()
+        reporter.join()
+        
+        # Let the writer drain everything queued so far
+        log_queue.put(None)
+        writer.join()
+        db.close()
+        
         # Add summary to files
         elapsed_time = time.time() - start_time
         
-        with open(all_domains_file, 'a') as f:
-            f.write(f"\n# Check completed or interrupted at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"# Total checked: {checked_count} out of {total}\n")
-            f.write(f"# Available domains found: {available_count}\n")
-            f.write(f"# Total elapsed time: {str(datetime.timedelta(seconds=int(elapsed_time)))}\n")
+        _write_all(all_fd, (
+            f"\n# Check completed or interrupted at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"# Total checked: {checked_count} out of {total}\n"
+            f"# Available domains found: {available_count}\n"
+            f"# Total elapsed time: {str(datetime.timedelta(seconds=int(elapsed_time)))}\n"
+        ).encode())
+        
+        _write_all(available_fd, (
+            f"\n# Check completed or interrupted at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"# Total available domains found: {available_count} out of {checked_count} checked\n"
+            f"# Total elapsed time: {str(datetime.timedelta(seconds=int(elapsed_time)))}\n"
+        ).encode())
         
-        with open(available_domains_file, 'a') as f:
-            f.write(f"\n# Check completed or interrupted at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"# Total available domains found: {available_count} out of {checked_count} checked\n")
-            f.write(f"# Total elapsed time: {str(datetime.timedelta(seconds=int(elapsed_time)))}\n")
+        for fd in (all_fd, available_fd):
+            os.fsync(fd)
+            os.close(fd)
         
         # Final summary to console
         print("\n" + "=" * 70)
-        print(f"{Fore.CYAN}Summary:{Style.RESET_ALL}")
+        print(f"{CYAN}Summary:{RESET}")
         print(f"Total domains checked: {checked_count} out of {total}")
-        print(f"{Fore.GREEN}Available domains found: {available_count}{Style.RESET_ALL}")
+        print(f"{GREEN}Available domains found: {available_count}{RESET}")
         print(f"Results saved to directory: {os.path.abspath(output_dir)}")
         print(f"  - All domains: {os.path.basename(all_domains_file)}")
         print(f"  - Available domains: {os.path.basename(available_domains_file)}")
@@ -275,7 +442,7 @@ def check_domains_multithreaded(start_domain="aaa", end_domain="zzz", output_dir
             domains_per_minute = domains_per_second * 60
             domains_per_hour = domains_per_minute * 60
             
-            print(f"\n{Fore.CYAN}Performance:{Style.RESET_ALL}")
+            print(f"\n{CYAN}Performance:{RESET}")
             print(f"Average speed: {domains_per_second:.2f} domains/second")
             print(f"              {domains_per_minute:.2f} domains/minute")
             print(f"              {domains_per_hour:.2f} domains/hour")
@@ -286,13 +453,23 @@ def check_domains_multithreaded(start_domain="aaa", end_domain="zzz", output_dir
 
 if __name__ == "__main__":
     # Set up argument parser
-    parser = argparse.ArgumentParser(description="Multi-threaded checker for 3-letter .com domains in alphabetical order")
+    parser = argparse.ArgumentParser(description="Concurrent checker for 3-letter .com domains in alphabetical order")
     parser.add_argument("--start", default="aaa", help="Starting domain prefix (default: aaa)")
     parser.add_argument("--end", default="zzz", help="Ending domain prefix (default: zzz)")
-    parser.add_argument("--threads", type=int, default=10, help="Number of threads to use (default: 10)")
+    parser.add_argument("--concurrency", "--threads", dest="concurrency", type=positive_int, default=200,
+                        help="Maximum number of WHOIS lookups in flight (default: 200)")
     parser.add_argument("--output-dir", default="domain_results", help="Directory to save results (default: domain_results)")
+    parser.add_argument("--trust-registry", action="store_true",
+                        help="Treat the registry's WHOIS 'No match' answer as final and skip the DNS/HTTP double check")
+    parser.add_argument("--width", type=int, default=3, choices=range(1, 7), metavar="{1-6}",
+                        help="Length of the names to sweep (default: 3)")
+    parser.add_argument("--resume", action="store_true",
+                        help=f"Skip domains already recorded in the output directory's {RESULTS_DB_NAME}")
+    parser.add_argument("--skip-unexpired", action="store_true",
+                        help=f"Skip domains {RESULTS_DB_NAME} records as taken with an expiry date still in the future")
     
     args = parser.parse_args()
     
-    check_domains_multithreaded(args.start, args.end, args.output_dir, args.threads)
-    print(f"\n{Fore.YELLOW}--- Check Complete ---{Style.RESET_ALL}") 
\ No newline at end of file
+    check_domains_multithreaded(args.start, args.end, args.output_dir, args.concurrency, args.resume, args.trust_registry, args.width,
+                                args.skip_unexpired)
+    print(f"\n{YELLOW}--- Check Complete ---{RESET}") 
\ No newline at end of file
@@ -1,15 +1,41 @@
-# Required packages: pip install python-whois requests colorama
+# Required packages: pip install python-whois requests colorama aiodns aiohttp
+# Optional: pip install uvloop (faster event loop for the async checks, not on Windows)
 import whois
+import aiodns
+import aiohttp
+import asyncio
 import concurrent.futures
+import re
+import random
 import socket
+import sqlite3
+import json
+import threading
+import time
+import functools
+from types import MappingProxyType
+from collections import OrderedDict
+from dataclasses import dataclass
+from whois.parser import WhoisEntry
 import requests
-from colorama import init, Fore, Style
+from requests.adapters import HTTPAdapter
 import webbrowser
 import sys
 import os
 
-# Initialize colorama for cross-platform colored terminal output
-init(autoreset=True)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Colour codes for console output. Only a terminal gets them (and colorama's
+# stream wrapper, needed on Windows); redirected output stays plain text
+if sys.stdout.isatty():
+    from colorama import init, Fore, Style
+    init(autoreset=True)
+    GREEN, RED, YELLOW, CYAN, RESET = Fore.GREEN, Fore.RED, Fore.YELLOW, Fore.CYAN, Style.RESET_ALL
+else:
+    GREEN = RED = YELLOW = CYAN = RESET = ""
 
 # List of top 20 most popular domain extensions
 TOP_20_TLDS = [
@@ -22,29 +48,138 @@ TOP_20_TLDS = [
 # TLDs that might benefit from double checking due to whois inconsistencies
 SPECIAL_TLDS = ['ai', 'io', 'co', 'me']
 
+# Registry WHOIS servers queried directly (port 43). These thin registries
+# answer with the registrar and expiry date themselves, so there is no IANA
+# lookup or registrar referral hop per domain. Other TLDs use python-whois's
+# own server table in the sync check.
+WHOIS_SERVERS = {
+    'com': 'whois.verisign-grs.com',
+    'net': 'whois.verisign-grs.com',
+}
+WHOIS_PORT = 43
+WHOIS_TIMEOUT = 10
+
+# WHOIS servers for other TLDs, as chosen by python-whois (which asks
+# whois.iana.org for most of them). Remembered in memory and on disk for
+# WHOIS_SERVER_CACHE_TTL seconds so that hop is made once a day, not per domain
+WHOIS_SERVER_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "domaintest", "whois_servers.json")
+WHOIS_SERVER_CACHE_TTL = 24 * 60 * 60
+_whois_servers = None
+_whois_servers_lock = threading.Lock()
+
+# Addresses of the WHOIS_SERVERS hosts, resolved once per run: each query opens
+# a new connection, and re-resolving the same registry host every time is wasted.
+# IPv4 only: python-whois can't use IPv6, and both check paths share the table
+_whois_addresses = {}
+
+# Attempts per async WHOIS query when the registry answers with a rate limit
+# notice; retries back off exponentially (1s, 2s, ... plus jitter)
+WHOIS_RETRIES = 3
+_WHOIS_RATE_LIMIT_RE = re.compile(r'limit exceeded|too many (?:requests|queries|connections)|rate limit', re.I)
+
+# Registries whose WHOIS "not found" answer is authoritative; with trust_registry
+# such an answer is reported as available without the DNS/HTTP double check
+AUTHORITATIVE_TLDS = frozenset({'com', 'net', 'cc', 'tv'})
+
+# Fields of interest in a thin registry WHOIS response
+_WHOIS_REGISTRAR_RE = re.compile(r'^\s*Registrar:[ \t]*(.*?)\s*$', re.M)
+_WHOIS_EXPIRY_RE = re.compile(r'^\s*Registry Expiry Date:[ \t]*(\d{4}-\d{2}-\d{2})', re.M)
+
+# The "Registrar: X (Expires: Y)" details line built for taken domains
+_REGISTRAR_DETAILS_RE = re.compile(r'Registrar:\s*(?P<reg>.*?)\s*(?:\(Expires:\s*(?P<exp>[^)]*?)\s*\))?\s*$', re.M)
+
+# DNS lookups made by the async double check: per-query timeout and
+# how many verdicts to remember so repeated checks within a run are free
+DNS_TIMEOUT = 2.0
+DNS_CACHE_SIZE = 4096
+_dns_cache = OrderedDict()
+_dns_resolver = None
+
+# Per-probe limit for the async HTTP/S HEAD requests
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=3)
+
+# Pooled session for the sync HTTP/S probes, so connections (and TLS sessions)
+# are kept alive and reused across checks instead of set up per request
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+
 # Popular domain registrars - using standard search URLs
 REGISTRARS = {
     'Porkbun': 'https://porkbun.com/checkout/search?q={}',
     'GoDaddy': 'https://www.godaddy.com/domainsearch/find?domainToCheck={}'
 }
 
+@dataclass(frozen=True, slots=True)
+class DomainResult:
+    """
+    Outcome of checking one domain. Slotted, as the interactive checker's LRU cache
+    can hold up to CHECK_LRU_SIZE of them.
+    Immutable (purchase_links is a read-only mapping), so memoized results can be shared safely.
+    """
+    domain: str
+    available: bool
+    message: str      # Coloured one-line verdict for the console
+    details: str      # Indented extra lines (registrar/expiry, check method, purchase links)
+    purchase_links: MappingProxyType
+
+    def __post_init__(self):
+        object.__setattr__(self, "purchase_links", MappingProxyType(dict(self.purchase_links)))
+
+# Recent verdicts are kept in a small SQLite database so re-running a check within
+# RESULT_CACHE_TTL seconds answers from disk instead of the network (use_cache=False skips it).
+# Only the plain verdict is stored; messages are rebuilt with the current colour codes
+RESULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "domaintest", "results.db")
+RESULT_CACHE_TTL = 300
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+# On top of that, check_domain memoizes results for the life of the process
+# (set DOMCHECK_NO_LRU=1 to turn this off)
+CHECK_LRU_SIZE = 4096
+
+# GoDaddy's bulk availability endpoint answers up to 500 names per POST.
+# Used only when GODADDY_API_KEY and GODADDY_API_SECRET are set in the environment.
+GODADDY_BULK_URL = 'https://api.godaddy.com/v1/domains/available?checkType=FAST'
+GODADDY_BULK_LIMIT = 500
+
+# One link builder per registrar, made once at import. Each template has exactly
+# one '{}' placeholder, so str.replace does the job without the str.format parser.
+_LINK_MAKERS = {name: (lambda d, _t=url_template: _t.replace('{}', d, 1))
+                for name, url_template in REGISTRARS.items()}
+
 def get_purchase_links(domain):
     """Generate purchase links for an available domain at popular registrars."""
-    links = {}
-    for name, url_template in REGISTRARS.items():
-        links[name] = url_template.format(domain)
-    return links
+    return {name: make(domain) for name, make in _LINK_MAKERS.items()}
 
 def open_purchase_link(url):
     """Open the purchase link in the default web browser."""
     try:
-        print(f"{Fore.CYAN}Attempting to open: {url}{Style.RESET_ALL}")
+        print(f"{CYAN}Attempting to open: {url}{RESET}")
         webbrowser.open(url)
         return True
     except Exception as e:
-        print(f"{Fore.RED}Error opening browser: {str(e)}{Style.RESET_ALL}")
+        print(f"{RED}Error opening browser: {str(e)}{RESET}")
         return False
 
+def _http_responds(domain):
+    """Return True if the domain answers an HTTP/S HEAD request with a non-error status."""
+    for scheme in ["https://", "http://"]:
+        try:
+            response = _http_session.head(f"{scheme}{domain}", timeout=3, allow_redirects=True)
+            if response.status_code < 400:
+                # If we get a successful response, it implies the domain is configured.
+                return True
+        except requests.Timeout:
+            # Timeout could mean server exists but is slow
+            # Treat timeout as inconclusive and assume available if no other signs
+            pass
+        except requests.RequestException:
+            # Connection errors are expected for truly available domains.
+            pass
+    return False
+
 def double_check_availability(domain):
     """
     Secondary verification using DNS/HTTP checks.
@@ -60,34 +195,332 @@ def double_check_availability(domain):
         pass
 
     # --- Check 2: HTTP/S HEAD Request ---
+    # If DNS lookup failed and HTTP requests failed, it's *likely* available.
+    return not _http_responds(domain)
+
+
+def create_http_session(limit=200):
+    """
+    Create the aiohttp session shared by all async HTTP probes of a run.
+    The caller owns it and must close it (e.g. "async with create_http_session() as session").
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=8,
+        keepalive_timeout=30,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        # c-ares needs a selector event loop, keep the default threaded resolver on Windows
+        resolver=aiohttp.ThreadedResolver() if sys.platform == "win32" else aiohttp.AsyncResolver(),
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+def run_async(main):
+    """Run an async entry point to completion, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+async def _http_responds_async(domain, session):
+    """Async counterpart of _http_responds using a shared aiohttp session."""
     for scheme in ["https://", "http://"]:
         try:
-            response = requests.head(f"{scheme}{domain}", timeout=3, allow_redirects=True)
-            if response.status_code < 400:
-                # If we get a successful response, it implies the domain is configured.
-                return False
-        except requests.Timeout:
-            # Timeout could mean server exists but is slow
-            # Treat timeout as inconclusive and assume available if no other signs
-            pass
-        except requests.RequestException:
-            # Connection errors are expected for truly available domains.
+            async with session.head(f"{scheme}{domain}", timeout=HTTP_TIMEOUT, allow_redirects=True) as response:
+                if response.status < 400:
+                    return True
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Connection errors and timeouts are expected for truly available domains.
             pass
+    return False
 
-    # If we reached here, DNS lookup failed, and HTTP requests failed, it's *likely* available.
-    return True
+def _get_dns_resolver():
+    """Return the c-ares resolver bound to the running event loop, creating it on first use."""
+    global _dns_resolver
+    loop = asyncio.get_running_loop()
+    if _dns_resolver is None or _dns_resolver.loop is not loop:
+        _dns_resolver = aiodns.DNSResolver(loop=loop, timeout=DNS_TIMEOUT, tries=1)
+    return _dns_resolver
+
+async def resolve_domain_async(domain):
+    """
+    Look up the domain's A record without blocking the event loop.
+    Returns True if it resolves, False on NXDOMAIN and None if the lookup was inconclusive.
+    """
+    if domain in _dns_cache:
+        _dns_cache.move_to_end(domain)
+        return _dns_cache[domain]
+
+    if sys.platform == "win32":
+        # c-ares needs a selector event loop; use the loop's threaded resolver instead
+        try:
+            await asyncio.get_running_loop().getaddrinfo(domain, None)
+            resolves = True
+        except socket.gaierror:
+            resolves = None
+    else:
+        try:
+            # query() is deprecated in aiodns 4 and warns on every call; query_dns()
+            # returns the whole response, so an empty answer section is a NODATA reply
+            result = await _get_dns_resolver().query_dns(domain, "A")
+            resolves = True if result.answer else None
+        except aiodns.error.DNSError as e:
+            # NXDOMAIN means nothing exists under the name; anything else (no A record, timeout) is inconclusive
+            resolves = False if e.args[0] == aiodns.error.ARES_ENOTFOUND else None
+
+    _dns_cache[domain] = resolves
+    if len(_dns_cache) > DNS_CACHE_SIZE:
+        _dns_cache.popitem(last=False)
+    return resolves
+
+async def double_check_availability_async(domain, session=None):
+    """
+    Async counterpart of double_check_availability.
+    An NXDOMAIN answer is taken as available without probing HTTP.
+    The HTTP/S probes go through `session` if given, otherwise through requests in a worker thread.
+    """
+    resolves = await resolve_domain_async(domain)
+    if resolves:
+        return False
+    if resolves is False:
+        return True
+
+    # DNS was inconclusive, fall back to the HTTP/S probes
+    if session is not None:
+        return not await _http_responds_async(domain, session)
+    loop = asyncio.get_running_loop()
+    return not await loop.run_in_executor(None, _http_responds, domain)
+
+
+def _registered_result(domain, registrar, expiry_str):
+    """Build the result for a domain that WHOIS reports as registered."""
+    return DomainResult(domain, False, f"{RED}❌ {domain} - Taken (WHOIS){RESET}",
+                        f"   Registrar: {registrar}{expiry_str}", {})
+
+
+def parse_registrar_details(details):
+    """Extract (registrar, expiry) from a taken domain's details line, "Unknown" where missing."""
+    match = _REGISTRAR_DETAILS_RE.search(details or "")
+    if not match:
+        return "Unknown", "Unknown"
+    return match.group("reg") or "Unknown", match.group("exp") or "Unknown"
+
+
+def _unregistered_result(domain):
+    """Build the result for a domain the authoritative registry reports as not registered."""
+    purchase_links = get_purchase_links(domain)
+    links_text = [f"   → {name}: {url}" for name, url in purchase_links.items()]
+    return DomainResult(domain, True, f"{GREEN}✅ {domain} - Available (Registry WHOIS){RESET}",
+                        "   (No match in registry WHOIS)\n" + "\n".join(links_text), purchase_links)
+
+
+def _registry_says_unregistered(domain, whois_text):
+    """True if the domain's TLD has an authoritative registry and its WHOIS text reports no match."""
+    return (domain.rsplit(".", 1)[-1] in AUTHORITATIVE_TLDS
+            and ("No match for" in whois_text or "NOT FOUND" in whois_text))
 
 
-def check_domain(domain):
-    """Check a single domain's availability using WHOIS and double-checking."""
+def _double_checked_result(domain, whois_error, is_truly_available):
+    """Build the result for a domain whose WHOIS was inconclusive, using the DNS/HTTP verdict."""
+    details_suffix = " (Checked via DNS/HTTP)" # To add info about double check method
+
+    if is_truly_available:
+        purchase_links = get_purchase_links(domain)
+        links_text = [f"   → {name}: {url}" for name, url in purchase_links.items()]
+        if whois_error:
+             prefix = f"{GREEN}✅ {domain} - Likely Available"
+             details_prefix = f"   ({whois_error}){details_suffix}\n"
+        else:
+             prefix = f"{GREEN}✅ {domain} - Available"
+             details_prefix = f"   (WHOIS empty){details_suffix}\n"
+
+        return DomainResult(domain, True, f"{prefix}{RESET}",
+                            details_prefix + "\n".join(links_text), purchase_links)
+    else:
+        # Double check indicates taken
+        if whois_error:
+            prefix = f"{RED}❌ {domain} - Likely Taken"
+            details_prefix = f"   ({whois_error}){details_suffix}"
+        else:
+             prefix = f"{RED}❌ {domain} - Taken"
+             details_prefix = f"   (WHOIS empty, but double-check indicates taken){details_suffix}"
+
+        return DomainResult(domain, False, f"{prefix}{RESET}", details_prefix, {})
+
+
+def _get_result_cache():
+    """Open the on-disk result cache on first use; call with _result_cache_lock held"""
+    global _result_cache
+    if _result_cache is None:
+        os.makedirs(os.path.dirname(RESULT_CACHE_PATH), exist_ok=True)
+        # Shared by the interactive checker's worker threads, serialized by the lock
+        db = sqlite3.connect(RESULT_CACHE_PATH, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS verdicts ("
+                   "domain TEXT, trust_registry INTEGER, verdict TEXT, checked_at REAL, "
+                   "PRIMARY KEY (domain, trust_registry))")
+        _result_cache = db
+    return _result_cache
+
+def _cached_verdict(domain, trust_registry):
+    """Return the cached verdict for (domain, trust_registry) if younger than RESULT_CACHE_TTL, else None."""
+    try:
+        with _result_cache_lock:
+            row = _get_result_cache().execute(
+                "SELECT verdict FROM verdicts WHERE domain = ? AND trust_registry = ? AND checked_at > ?",
+                (domain, bool(trust_registry), time.time() - RESULT_CACHE_TTL)).fetchone()
+    except (sqlite3.Error, OSError):
+        # An unusable cache (read-only home, locked file...) just means a live check
+        return None
+    return json.loads(row[0]) if row else None
+
+def _cache_verdict(domain, trust_registry, verdict):
+    """Store a fresh verdict in the on-disk cache, dropping expired ones, and ignore cache errors."""
+    now = time.time()
+    try:
+        with _result_cache_lock:
+            db = _get_result_cache()
+            # Expired rows are never read again; clearing them here keeps the file small
+            db.execute("DELETE FROM verdicts WHERE checked_at <= ?", (now - RESULT_CACHE_TTL,))
+            db.execute("INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?)",
+                       (domain, bool(trust_registry), json.dumps(verdict), now))
+    except (sqlite3.Error, OSError):
+        pass
+
+# A verdict is the plain outcome of a check: a builder name plus its arguments
+_VERDICT_BUILDERS = {
+    "registered": _registered_result,                # (registrar, expiry_str)
+    "unregistered": _unregistered_result,            # ()
+    "double_checked": _double_checked_result,        # (whois_error, is_truly_available)
+}
+
+def _result_from_verdict(domain, verdict):
+    """Build the displayable DomainResult for a verdict."""
+    kind, *args = verdict
+    return _VERDICT_BUILDERS[kind](domain, *args)
+
+
+def _whois_server_address(server):
+    """Return a cached IPv4 address for a WHOIS server host, resolving it on first use."""
+    address = _whois_addresses.get(server)
+    if address is None:
+        # NICClient always connects over an AF_INET socket, so an IPv6 address is no use to it
+        infos = socket.getaddrinfo(server, WHOIS_PORT, socket.AF_INET, socket.SOCK_STREAM)
+        address = _whois_addresses[server] = infos[0][4][0]
+    return address
+
+async def _whois_server_address_async(server):
+    """Async variant of _whois_server_address, resolving through the event loop."""
+    address = _whois_addresses.get(server)
+    if address is None:
+        infos = await asyncio.get_running_loop().getaddrinfo(server, WHOIS_PORT, family=socket.AF_INET,
+                                                             type=socket.SOCK_STREAM)
+        address = _whois_addresses[server] = infos[0][4][0]
+    return address
+
+
+def _load_whois_servers():
+    """Read the still-fresh entries of the on-disk WHOIS server cache ({suffix: [server, saved_at]})."""
+    try:
+        with open(WHOIS_SERVER_CACHE_PATH) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    cutoff = time.time() - WHOIS_SERVER_CACHE_TTL
+    return {suffix: entry for suffix, entry in entries.items() if entry[1] > cutoff}
+
+def _whois_server_for(domain, nic_client):
+    """
+    Return the WHOIS server python-whois would pick for domain, cached per suffix
+    (everything after the first label) in memory and on disk.
+    """
+    suffix = domain.split(".", 1)[-1]
+    global _whois_servers
+    with _whois_servers_lock:
+        if _whois_servers is None:
+            _whois_servers = _load_whois_servers()
+        entry = _whois_servers.get(suffix)
+    if entry:
+        return entry[0]
+
+    # Left as a hostname: NICClient adapts the query format for some servers by name
+    server = nic_client.choose_server(domain)
+    if server:
+        with _whois_servers_lock:
+            _whois_servers[suffix] = [server, time.time()]
+            try:
+                os.makedirs(os.path.dirname(WHOIS_SERVER_CACHE_PATH), exist_ok=True)
+                tmp_path = f"{WHOIS_SERVER_CACHE_PATH}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(_whois_servers, f)
+                os.replace(tmp_path, WHOIS_SERVER_CACHE_PATH)
+            except OSError:
+                pass
+    return server
+
+
+def _query_whois(domain):
+    """
+    Fetch the registry's raw WHOIS text over a single socket.
+    Unlike whois.whois(), registrar referrals are not followed (availability only
+    needs the registry's answer), and the IANA lookup for the server is made at most
+    once a day per TLD (see _whois_server_for).
+    """
+    nic_client = whois.NICClient()
+    tld = domain.rsplit(".", 1)[-1]
+    if tld in WHOIS_SERVERS:
+        server = _whois_server_address(WHOIS_SERVERS[tld])
+    else:
+        server = _whois_server_for(domain, nic_client)
+    text = nic_client.whois(domain, server, 0, timeout=WHOIS_TIMEOUT, quiet=True,
+                            ignore_socket_errors=False) if server else ""
+    if not text:
+        raise whois.exceptions.WhoisError("Whois command returned no output")
+    return text
+
+
+def check_domain(domain, trust_registry=False, use_cache=True):
+    """
+    Check a single domain's availability using WHOIS and double-checking.
+    With trust_registry, a "no match" answer from an authoritative registry skips the double check.
+    With use_cache, a result already seen in this process or in the last RESULT_CACHE_TTL
+    seconds is returned without a lookup.
+    """
+    if not use_cache:
+        return _result_from_verdict(domain, _check_domain(domain, trust_registry))
+    return _check_domain_cached(domain, trust_registry)
+
+
+def _check_domain_cached(domain, trust_registry):
+    """check_domain behind the on-disk result cache."""
+    verdict = _cached_verdict(domain, trust_registry)
+    if verdict is None:
+        verdict = _check_domain(domain, trust_registry)
+        _cache_verdict(domain, trust_registry, verdict)
+    return _result_from_verdict(domain, verdict)
+
+if not os.environ.get("DOMCHECK_NO_LRU"):
+    _check_domain_cached = functools.lru_cache(maxsize=CHECK_LRU_SIZE)(_check_domain_cached)
+
+
+def _check_domain(domain, trust_registry):
+    """Uncached body of check_domain, returning the verdict (see _VERDICT_BUILDERS)."""
     whois_info = None
     whois_error = None
-    details_suffix = "" # To add info about double check method
 
     try:
-        whois_info = whois.whois(domain)
-    except whois.exceptions.WhoisCommandTimeout:
+        whois_text = _query_whois(domain)
+        # Look at the raw answer before parsing: python-whois only raises on "No match"
+        # for .com/.net and hands back an empty entry for the other registries
+        if trust_registry and _registry_says_unregistered(domain, whois_text):
+            return ("unregistered",)
+        whois_info = WhoisEntry.load(domain, whois_text)
+    except socket.timeout:
         whois_error = "WHOIS Timeout"
+    except whois.exceptions.WhoisDomainNotFoundError:
+        # A plain "no match" answer, not an error: confirmed via DNS/HTTP like the async path does
+        pass
     except Exception as e:
         whois_error = f"WHOIS Error: {str(e).splitlines()[0][:70]}..."
 
@@ -110,54 +543,120 @@ def check_domain(domain):
             except AttributeError:
                 expiry_str = f" (Expires: {expiry_date})"
         registrar = whois_info.registrar if whois_info.registrar else "Unknown"
-        return {
-            "domain": domain,
-            "available": False,
-            "message": f"{Fore.RED}❌ {domain} - Taken (WHOIS){Style.RESET_ALL}",
-            "details": f"   Registrar: {registrar}{expiry_str}",
-            "purchase_links": {}
-        }
+        return ("registered", registrar, expiry_str)
     else:
         # WHOIS is inconclusive (error or no registration data found).
         # Perform the double check.
         is_truly_available = double_check_availability(domain)
-        details_suffix = " (Checked via DNS/HTTP)"
-
-        if is_truly_available:
-            purchase_links = get_purchase_links(domain)
-            links_text = [f"   → {name}: {url}" for name, url in purchase_links.items()]
-            prefix = f"{Fore.GREEN}✅ {domain} - Available"
-            if whois_error:
-                 prefix = f"{Fore.GREEN}✅ {domain} - Likely Available"
-                 details_prefix = f"   ({whois_error}){details_suffix}\n"
-            else:
-                 prefix = f"{Fore.GREEN}✅ {domain} - Available"
-                 details_prefix = f"   (WHOIS empty){details_suffix}\n"
-
-            return {
-                "domain": domain,
-                "available": True,
-                "message": f"{prefix}{Style.RESET_ALL}",
-                "details": details_prefix + "\n".join(links_text),
-                "purchase_links": purchase_links
-            }
-        else:
-            # Double check indicates taken
-            details_prefix = ""
-            if whois_error:
-                prefix = f"{Fore.RED}❌ {domain} - Likely Taken"
-                details_prefix = f"   ({whois_error}){details_suffix}"
-            else:
-                 prefix = f"{Fore.RED}❌ {domain} - Taken"
-                 details_prefix = f"   (WHOIS empty, but double-check indicates taken){details_suffix}"
+        return ("double_checked", whois_error, is_truly_available)
 
-            return {
-                "domain": domain,
-                "available": False,
-                "message": f"{prefix}{Style.RESET_ALL}",
-                "details": details_prefix,
-                "purchase_links": {}
-            }
+
+async def query_whois_async(domain, server, timeout=WHOIS_TIMEOUT):
+    """Send one WHOIS query over a raw TCP connection and return the response text."""
+    address = await _whois_server_address_async(server)
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(address, WHOIS_PORT), timeout)
+    try:
+        writer.write(domain.encode("idna") + b"\r\n")
+        await writer.drain()
+        # The server closes the connection once the full response is sent
+        response = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+    return response.decode("utf-8", "replace")
+
+
+async def check_domain_async(domain, session=None, timeout=WHOIS_TIMEOUT, trust_registry=False, use_cache=True):
+    """
+    Async variant of check_domain for bulk sweeps.
+    Queries the registry WHOIS server directly instead of going through python-whois,
+    falling back to check_domain in a worker thread for TLDs without a known server.
+    Pass a session from create_http_session() to share one connection pool across checks.
+    """
+    # The cache is blocking SQLite behind a lock, so keep it off the event loop
+    loop = asyncio.get_running_loop()
+    verdict = await loop.run_in_executor(None, _cached_verdict, domain, trust_registry) if use_cache else None
+    if verdict is None:
+        verdict = await _check_domain_async(domain, session, timeout, trust_registry)
+        if use_cache:
+            await loop.run_in_executor(None, _cache_verdict, domain, trust_registry, verdict)
+    return _result_from_verdict(domain, verdict)
+
+
+async def _check_domain_async(domain, session, timeout, trust_registry):
+    """Uncached body of check_domain_async, returning the verdict (see _VERDICT_BUILDERS)."""
+    loop = asyncio.get_running_loop()
+    server = WHOIS_SERVERS.get(domain.rsplit(".", 1)[-1])
+    if server is None:
+        return await loop.run_in_executor(None, _check_domain, domain, trust_registry)
+
+    for attempt in range(WHOIS_RETRIES):
+        whois_error = None
+        try:
+            text = await query_whois_async(domain, server, timeout)
+        except asyncio.TimeoutError:
+            text = ""
+            whois_error = "WHOIS Timeout"
+        except OSError as e:
+            text = ""
+            whois_error = f"WHOIS Error: {str(e)[:70]}..."
+        if whois_error or attempt == WHOIS_RETRIES - 1 or not _WHOIS_RATE_LIMIT_RE.search(text):
+            break
+        # Throttled: back off and ask again rather than misreading the notice
+        await asyncio.sleep(2 ** attempt + random.random())
+
+    if trust_registry and not whois_error and _registry_says_unregistered(domain, text):
+        return ("unregistered",)
+
+    if not whois_error and "No match for" not in text:
+        registrar_match = _WHOIS_REGISTRAR_RE.search(text)
+        if registrar_match:
+            expiry_match = _WHOIS_EXPIRY_RE.search(text)
+            expiry_str = f" (Expires: {expiry_match.group(1)})" if expiry_match else ""
+            return ("registered", registrar_match.group(1) or "Unknown", expiry_str)
+        # Neither a match nor a "not found" answer, e.g. a rate limit notice
+        first_line = text.strip().splitlines()[0] if text.strip() else "empty response"
+        whois_error = f"WHOIS Error: {first_line[:70]}..."
+
+    # WHOIS is inconclusive or reports no match, confirm via DNS/HTTP
+    is_truly_available = await double_check_availability_async(domain, session)
+    return ("double_checked", whois_error, is_truly_available)
+
+
+def check_domains_bulk(names):
+    """
+    Check many domains with GoDaddy's bulk availability API, one POST per 500 names.
+    Returns {domain: DomainResult} for the names the API answered, or None when
+    no API credentials are configured or a request fails; callers then fall back
+    to the per-domain WHOIS path (also for any names missing from the answer).
+    """
+    key = os.environ.get("GODADDY_API_KEY")
+    secret = os.environ.get("GODADDY_API_SECRET")
+    if not (key and secret):
+        return None
+
+    headers = {"Authorization": f"sso-key {key}:{secret}", "Accept": "application/json"}
+    results = {}
+    for i in range(0, len(names), GODADDY_BULK_LIMIT):
+        try:
+            response = _http_session.post(GODADDY_BULK_URL, json=names[i:i + GODADDY_BULK_LIMIT],
+                                          headers=headers, timeout=WHOIS_TIMEOUT)
+            response.raise_for_status()
+            answers = response.json().get("domains", [])
+        except (requests.RequestException, ValueError):
+            return None
+        for answer in answers:
+            domain = answer.get("domain", "").lower()
+            if answer.get("available"):
+                purchase_links = get_purchase_links(domain)
+                links_text = [f"   → {name}: {url}" for name, url in purchase_links.items()]
+                results[domain] = DomainResult(
+                    domain, True, f"{GREEN}✅ {domain} - Available (GoDaddy API){RESET}",
+                    "   (GoDaddy availability API)\n" + "\n".join(links_text), purchase_links)
+            else:
+                results[domain] = DomainResult(
+                    domain, False, f"{RED}❌ {domain} - Taken (GoDaddy API){RESET}",
+                    "   (GoDaddy availability API)", {})
+    return results
 
 
 def check_domain_availability(base_domain, tlds=None, max_workers=10):
@@ -165,9 +664,9 @@ def check_domain_availability(base_domain, tlds=None, max_workers=10):
     if tlds is None:
         tlds = TOP_20_TLDS
 
-    print(f"\n{Fore.CYAN}Checking availability for '{base_domain}' across {len(tlds)} TLDs...{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}Using up to {max_workers} parallel checks.{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}Note: Results rely on WHOIS and DNS/HTTP checks. Availability not guaranteed until registration.{Style.RESET_ALL}")
+    print(f"\n{CYAN}Checking availability for '{base_domain}' across {len(tlds)} TLDs...{RESET}")
+    print(f"{YELLOW}Using up to {max_workers} parallel checks.{RESET}")
+    print(f"{YELLOW}Note: Results rely on WHOIS and DNS/HTTP checks. Availability not guaranteed until registration.{RESET}")
     print("=" * 60)
 
     results = []
@@ -183,47 +682,47 @@ def check_domain_availability(base_domain, tlds=None, max_workers=10):
                 try:
                     result = future.result()
                     results.append(result)
-                    print(result["message"])
-                    if result["details"]:
-                        print(result["details"])
-                    if result["available"]:
+                    print(result.message)
+                    if result.details:
+                        print(result.details)
+                    if result.available:
                         available_domains_list.append(result)
                 except Exception as exc:
-                    print(f"{Fore.RED}❌ {domain} generated an exception during future processing: {exc}{Style.RESET_ALL}")
-                    results.append({
-                        "domain": domain, "available": False,
-                        "message": f"{Fore.RED}❌ {domain} - Error during check processing{Style.RESET_ALL}",
-                        "details": f"   Error: {str(exc)[:100]}...", "purchase_links": {}
-                    })
+                    print(f"{RED}❌ {domain} generated an exception during future processing: {exc}{RESET}")
+                    results.append(DomainResult(
+                        domain, False,
+                        f"{RED}❌ {domain} - Error during check processing{RESET}",
+                        f"   Error: {str(exc)[:100]}...", {}
+                    ))
 
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}Ctrl+C detected. Shutting down gracefully...{Style.RESET_ALL}")
+        print(f"\n{YELLOW}Ctrl+C detected. Shutting down gracefully...{RESET}")
         # executor.shutdown(wait=False, cancel_futures=True) # Use in Python 3.9+ if needed
         sys.exit(1)
 
 
     # Summary
-    available_count = sum(1 for r in results if r["available"])
-    taken_count = sum(1 for r in results if not r["available"] and "Error" not in r["message"]) # Simplified count
+    available_count = sum(1 for r in results if r.available)
+    taken_count = sum(1 for r in results if not r.available and "Error" not in r.message) # Simplified count
     uncertain_count = len(results) - available_count - taken_count
 
     print("=" * 60)
-    print(f"\n{Fore.CYAN}Summary:{Style.RESET_ALL}")
+    print(f"\n{CYAN}Summary:{RESET}")
     print(f"Total domains checked: {len(results)}")
-    print(f"{Fore.GREEN}Available: {available_count}{Style.RESET_ALL}")
-    print(f"{Fore.RED}Taken/Unavailable: {taken_count + uncertain_count}{Style.RESET_ALL}") # Combine uncertain/error with taken for simplicity
+    print(f"{GREEN}Available: {available_count}{RESET}")
+    print(f"{RED}Taken/Unavailable: {taken_count + uncertain_count}{RESET}") # Combine uncertain/error with taken for simplicity
 
     # Interactive part: Offer to open purchase links
     if available_domains_list:
-        print(f"\n{Fore.CYAN}Available Domains Found:{Style.RESET_ALL}")
+        print(f"\n{CYAN}Available Domains Found:{RESET}")
         
         first_registrar = next(iter(REGISTRARS))
         for i, domain_data in enumerate(available_domains_list, 1):
-            print(f"{i}. {domain_data['domain']}")
-            if first_registrar in domain_data['purchase_links']:
-                 print(f"   {Fore.CYAN}Buy at {first_registrar}:{Style.RESET_ALL} {domain_data['purchase_links'][first_registrar]}")
+            print(f"{i}. {domain_data.domain}")
+            if first_registrar in domain_data.purchase_links:
+                 print(f"   {CYAN}Buy at {first_registrar}:{RESET} {domain_data.purchase_links[first_registrar]}")
 
-        print(f"\n{Fore.YELLOW}Open a purchase link in browser?{Style.RESET_ALL}")
+        print(f"\n{YELLOW}Open a purchase link in browser?{RESET}")
         while True:
             choice = input(f"Enter number (1-{len(available_domains_list)}) to open the '{first_registrar}' link, or just press Enter to skip: ").strip()
             if not choice:
@@ -234,22 +733,22 @@ def check_domain_availability(base_domain, tlds=None, max_workers=10):
                 choice_idx = int(choice) - 1
                 if 0 <= choice_idx < len(available_domains_list):
                     selected_domain_data = available_domains_list[choice_idx]
-                    if first_registrar in selected_domain_data['purchase_links']:
-                        link_to_open = selected_domain_data['purchase_links'][first_registrar]
-                        print(f"\n{Fore.GREEN}Opening {first_registrar} link for {selected_domain_data['domain']}...{Style.RESET_ALL}")
+                    if first_registrar in selected_domain_data.purchase_links:
+                        link_to_open = selected_domain_data.purchase_links[first_registrar]
+                        print(f"\n{GREEN}Opening {first_registrar} link for {selected_domain_data.domain}...{RESET}")
                         opened = open_purchase_link(link_to_open)
                         if opened:
-                            print(f"{Fore.GREEN}Browser should have opened. Good luck!{Style.RESET_ALL}")
+                            print(f"{GREEN}Browser should have opened. Good luck!{RESET}")
                         else:
-                            print(f"{Fore.YELLOW}If the browser didn't open, you can manually visit:{Style.RESET_ALL}")
+                            print(f"{YELLOW}If the browser didn't open, you can manually visit:{RESET}")
                             print(link_to_open)
                         break
                     else:
-                        print(f"{Fore.RED}Error: Could not find '{first_registrar}' link for the selected domain.{Style.RESET_ALL}")
+                        print(f"{RED}Error: Could not find '{first_registrar}' link for the selected domain.{RESET}")
                 else:
-                    print(f"{Fore.RED}Invalid number. Please enter a number between 1 and {len(available_domains_list)}.{Style.RESET_ALL}")
+                    print(f"{RED}Invalid number. Please enter a number between 1 and {len(available_domains_list)}.{RESET}")
             else:
-                print(f"{Fore.RED}Invalid input. Please enter a number or press Enter.{Style.RESET_ALL}")
+                print(f"{RED}Invalid input. Please enter a number or press Enter.{RESET}")
 
     return results
 
@@ -258,19 +757,19 @@ def validate_domain_name(name):
     if not name:
         return False
     if " " in name or "." in name or "/" in name or "\\" in name:
-         print(f"{Fore.RED}Invalid characters (space, dot, slashes) found.{Style.RESET_ALL}")
+         print(f"{RED}Invalid characters (space, dot, slashes) found.{RESET}")
          return False
     if name.startswith('-') or name.endswith('-'):
-        print(f"{Fore.RED}Domain part cannot start or end with a hyphen.{Style.RESET_ALL}")
+        print(f"{RED}Domain part cannot start or end with a hyphen.{RESET}")
         return False
     if not all(c.isalnum() or c == '-' for c in name):
-        print(f"{Fore.RED}Invalid characters. Use only letters, numbers, and hyphens.{Style.RESET_ALL}")
+        print(f"{RED}Invalid characters. Use only letters, numbers, and hyphens.{RESET}")
         return False
     return True
 
 def main():
     """Main function to run the domain checker tool."""
-    print(f"{Fore.YELLOW}--- Domain Availability Checker ---{Style.RESET_ALL}")
+    print(f"{YELLOW}--- Domain Availability Checker ---{RESET}")
     print("Checks availability using WHOIS and secondary DNS/HTTP checks.")
     print(f"TLDs checked: {', '.join(TOP_20_TLDS)}")
     print("-" * 30)
@@ -281,7 +780,7 @@ def main():
             break
 
     check_domain_availability(base_domain)
-    print(f"\n{Fore.YELLOW}--- Check Complete ---{Style.RESET_ALL}")
+    print(f"\n{YELLOW}--- Check Complete ---{RESET}")
 
 
 if __name__ == "__main__":
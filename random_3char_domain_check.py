@@ -5,73 +5,182 @@
 import random
 import string
 import sys
-from domaintest import check_domain, get_purchase_links, open_purchase_link
-from colorama import Fore, Style, init
+import os
+import argparse
+import asyncio
 
-# Initialize colorama
-init(autoreset=True)
+# The shared checker module. It pulls in aiohttp, python-whois and requests (~0.2 s of
+# start-up) that --help or a bad argument never needs, so main() imports it after parsing
+domaintest = None
+
+# Default number of lookups in flight at once; registries throttle bursts
+# from one address, so keep this modest (override with DOMCHECK_CONC or --concurrency)
+DEFAULT_CONCURRENCY = 8
+
+# Upper bound for one domain's whole check (WHOIS with rate-limit retries plus the
+# DNS/HTTP double check), so a single unresponsive server can't hold up the summary
+CHECK_TIMEOUT = 20
+
+# Name alphabet: a-z, 0-9. There are only 36**3 distinct 3-character names.
+CHARS = string.ascii_lowercase + string.digits
+NAME_SPACE = len(CHARS) ** 3
+
+# Private generator, seeded once from OS entropy, rather than the random module's shared instance
+_rng = random.Random()
+
+def _idx_to_name(i):
+    """Map an index in range(NAME_SPACE) to its 3-character name (base 36 over CHARS)"""
+    return CHARS[i // 1296] + CHARS[i // 36 % 36] + CHARS[i % 36]
 
 def generate_random_3char():
     """Generate a random 3-character string using lowercase letters and numbers"""
-    chars = string.ascii_lowercase + string.digits  # a-z, 0-9
-    return ''.join(random.choice(chars) for _ in range(3))
+    # One random draw over the whole name space; indexing CHARS yields
+    # CPython's cached one-character strings, so nothing is allocated per letter
+    return _idx_to_name(_rng.randrange(NAME_SPACE))
+
+def generate_unique_3char(count):
+    """Draw count distinct random 3-character names in one pass, no retries on collisions"""
+    return [_idx_to_name(i) for i in _rng.sample(range(NAME_SPACE), count)]
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1 (also used by all_3char_alpha_check)"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a whole number")
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be positive")
+    return number
+
+def _name_count(value):
+    """argparse type for the number of names to draw: 1 up to every possible name"""
+    number = positive_int(value)
+    if number > NAME_SPACE:
+        raise argparse.ArgumentTypeError(f"there are only {NAME_SPACE} 3-character names")
+    return number
+
+def _registrar_name(value):
+    """Return the REGISTRARS name matching value, ignoring case, or None"""
+    for name in domaintest.REGISTRARS:
+        if name.lower() == value.lower():
+            return name
+    return None
+
+def _parse_args():
+    """Parse the command line, returning the parser (for later errors) and the arguments"""
+    # Set up argument parser. Only the standard library is needed here, so --help and
+    # bad arguments exit before main() imports domaintest
+    parser = argparse.ArgumentParser(description="Check random 3-character .com domains for availability",
+                                     epilog="Example: python random_3char_domain_check.py 5")
+    parser.add_argument("count", nargs="?", type=_name_count, default=3,
+                        help="Number of domains to check (default: 3)")
+    # A string default goes through type= too, so $DOMCHECK_CONC gets validated like the flag
+    parser.add_argument("--concurrency", type=positive_int,
+                        default=os.environ.get("DOMCHECK_CONC", str(DEFAULT_CONCURRENCY)),
+                        help=f"Maximum number of lookups in flight (default: $DOMCHECK_CONC or {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false",
+                        help="Ignore recently cached results and query every domain live")
+    parser.add_argument("--open", dest="open_choice", type=positive_int, metavar="N",
+                        help="Open the purchase link of the Nth available domain without prompting")
+    parser.add_argument("--registrar",
+                        help="Registrar whose purchase link to open, e.g. Porkbun or GoDaddy "
+                             "(default: ask, or the first one with --open)")
+    
+    return parser, parser.parse_args()
+
+async def _run(domains, concurrency, report, use_cache=True):
+    """Check every domain over one shared HTTP session, at most concurrency at a time, passing each result to report as it arrives"""
+    sem = asyncio.Semaphore(concurrency)
+    async def check(domain):
+        async with sem:
+            try:
+                return await asyncio.wait_for(domaintest.check_domain_async(domain, session, use_cache=use_cache), CHECK_TIMEOUT)
+            except asyncio.TimeoutError:
+                return domaintest.DomainResult(domain, False, f"{domaintest.YELLOW}⚠️ {domain} - Check timed out{domaintest.RESET}",
+                                               f"   (No verdict within {CHECK_TIMEOUT}s)", {})
+    
+    async with domaintest.create_http_session(limit=64) as session:
+        for next_result in asyncio.as_completed([asyncio.ensure_future(check(domain)) for domain in domains]):
+            report(await next_result)
+
+def _open_domain_link(domain_data, registrar):
+    """Open domain_data's purchase link at registrar, printing the URL if no browser opens"""
+    link_to_open = domain_data.purchase_links[registrar]
+    
+    print(f"\n{domaintest.GREEN}Opening {registrar} link for {domain_data.domain}...{domaintest.RESET}")
+    opened = domaintest.open_purchase_link(link_to_open)
+    
+    if not opened:
+        print(f"{domaintest.YELLOW}If the browser didn't open, you can manually visit:{domaintest.RESET}")
+        print(link_to_open)
 
-def check_3char_domains(count=3):
-    """Generate and check availability of random 3-character .com domains"""
-    print(f"{Fore.CYAN}===== 3-Character .COM Domain Availability Checker ====={Style.RESET_ALL}")
+def check_3char_domains(count=3, concurrency=DEFAULT_CONCURRENCY, use_cache=True, open_choice=None, registrar=None):
+    """
+    Generate and check availability of random 3-character .com domains.
+    open_choice (1-based number of an available domain) and registrar pick the purchase
+    link to open without prompting; without open_choice the prompt is only shown on a terminal.
+    """
+    print(f"{domaintest.CYAN}===== 3-Character .COM Domain Availability Checker ====={domaintest.RESET}")
     print(f"Checking {count} randomly generated 3-character domains")
-    print(f"{Fore.YELLOW}Note: 3-character domains are rare and valuable if available{Style.RESET_ALL}")
+    print(f"{domaintest.YELLOW}Note: 3-character domains are rare and valuable if available{domaintest.RESET}")
     print("-" * 60)
     
     available_domains = []
-    checked_domains = set()  # To avoid checking duplicates
     
-    while len(checked_domains) < count:
-        # Generate domain and add .com
-        base = generate_random_3char()
-        if base in checked_domains:
-            continue  # Skip duplicates
-            
-        domain = f"{base}.com"
-        checked_domains.add(base)
-        
-        print(f"\n{Fore.YELLOW}Checking: {domain}{Style.RESET_ALL}")
-        
-        # Use the existing check_domain function from domaintest.py
-        result = check_domain(domain)
+    def report(result):
+        """Display one result as soon as it is known, in a single write"""
+        output = [f"\n{domaintest.YELLOW}Checking: {result.domain}{domaintest.RESET}", result.message]
+        if result.details:
+            output.append(result.details)
+        sys.stdout.write("\n".join(output) + "\n")
         
-        # Display result
-        print(result["message"])
-        if result["details"]:
-            print(result["details"])
-            
         # Save available domains
-        if result["available"]:
+        if result.available:
             available_domains.append(result)
     
+    # Draw the whole batch up front and check it all at once
+    domains = [f"{base}.com" for base in generate_unique_3char(count)]
+    
+    # One bulk API call when credentials are configured; WHOIS for whatever it didn't answer
+    bulk = domaintest.check_domains_bulk(domains) or {}
+    for result in bulk.values():
+        report(result)
+    remaining = [domain for domain in domains if domain not in bulk]
+    if remaining:
+        domaintest.run_async(_run(remaining, concurrency, report, use_cache))
+    
     # Summary
     print("\n" + "=" * 60)
-    print(f"{Fore.CYAN}Summary:{Style.RESET_ALL}")
+    print(f"{domaintest.CYAN}Summary:{domaintest.RESET}")
     print(f"Total domains checked: {count}")
-    print(f"{Fore.GREEN}Available: {len(available_domains)}{Style.RESET_ALL}")
-    print(f"{Fore.RED}Taken/Unavailable: {count - len(available_domains)}{Style.RESET_ALL}")
+    print(f"{domaintest.GREEN}Available: {len(available_domains)}{domaintest.RESET}")
+    print(f"{domaintest.RED}Taken/Unavailable: {count - len(available_domains)}{domaintest.RESET}")
     
     # Interactive part for available domains
     if available_domains:
-        print(f"\n{Fore.GREEN}Available Domains Found:{Style.RESET_ALL}")
+        print(f"\n{domaintest.GREEN}Available Domains Found:{domaintest.RESET}")
         for i, domain_data in enumerate(available_domains, 1):
-            domain_name = domain_data["domain"]
+            domain_name = domain_data.domain
             print(f"{i}. {domain_name}")
             
             # Display purchase links
-            purchase_links = domain_data["purchase_links"]
-            if purchase_links:
-                for registrar, link in purchase_links.items():
-                    print(f"   → {registrar}: {link}")
+            links = domain_data.purchase_links.items()
+            if links:
+                print("\n".join(f"   → {registrar}: {link}" for registrar, link in links))
+        
+        # Open a purchase link picked on the command line
+        if open_choice is not None:
+            if open_choice > len(available_domains):
+                print(f"{domaintest.RED}--open {open_choice}: only {len(available_domains)} available domain(s) found.{domaintest.RESET}")
+            else:
+                selected_domain = available_domains[open_choice - 1]
+                if registrar not in selected_domain.purchase_links:
+                    registrar = next(iter(selected_domain.purchase_links))
+                _open_domain_link(selected_domain, registrar)
         
-        # Offer to open a purchase link
-        if available_domains:
-            print(f"\n{Fore.YELLOW}Would you like to open a purchase link in your browser?{Style.RESET_ALL}")
+        # Offer to open a purchase link (only when someone is there to answer)
+        elif sys.stdin.isatty():
+            print(f"\n{domaintest.YELLOW}Would you like to open a purchase link in your browser?{domaintest.RESET}")
             while True:
                 choice = input(f"Enter domain number (1-{len(available_domains)}) or press Enter to skip: ").strip()
                 if not choice:
@@ -82,10 +191,13 @@ def check_3char_domains(count=3):
                     selected_idx = int(choice) - 1
                     selected_domain = available_domains[selected_idx]
                     
-                    # Ask which registrar
-                    registrars = list(selected_domain["purchase_links"].keys())
+                    # Ask which registrar, unless one was given on the command line
+                    registrars = list(selected_domain.purchase_links.keys())
+                    if registrar in selected_domain.purchase_links:
+                        _open_domain_link(selected_domain, registrar)
+                        break
                     if registrars:
-                        print(f"Available registrars for {selected_domain['domain']}:")
+                        print(f"Available registrars for {selected_domain.domain}:")
                         for i, reg in enumerate(registrars, 1):
                             print(f"{i}. {reg}")
                         
@@ -96,37 +208,28 @@ def check_3char_domains(count=3):
                         else:
                             reg_idx = int(reg_choice) - 1
                             
-                        selected_registrar = registrars[reg_idx]
-                        link_to_open = selected_domain["purchase_links"][selected_registrar]
-                        
-                        print(f"\n{Fore.GREEN}Opening {selected_registrar} link for {selected_domain['domain']}...{Style.RESET_ALL}")
-                        opened = open_purchase_link(link_to_open)
-                        
-                        if not opened:
-                            print(f"{Fore.YELLOW}If the browser didn't open, you can manually visit:{Style.RESET_ALL}")
-                            print(link_to_open)
-                        
+                        _open_domain_link(selected_domain, registrars[reg_idx])
                         break
                 else:
-                    print(f"{Fore.RED}Invalid choice. Please enter a number between 1 and {len(available_domains)}.{Style.RESET_ALL}")
+                    print(f"{domaintest.RED}Invalid choice. Please enter a number between 1 and {len(available_domains)}.{domaintest.RESET}")
     else:
-        print(f"\n{Fore.YELLOW}No available domains found in this batch.{Style.RESET_ALL}")
+        print(f"\n{domaintest.YELLOW}No available domains found in this batch.{domaintest.RESET}")
         print("Try running the script again for a new set of random domains.")
 
-if __name__ == "__main__":
-    # Get number of domains to check from command line argument, default to 3
-    try:
-        if len(sys.argv) > 1:
-            count = int(sys.argv[1])
-            if count < 1:
-                raise ValueError("Count must be positive")
-        else:
-            count = 3
-    except ValueError as e:
-        print(f"{Fore.RED}Error: {str(e)}{Style.RESET_ALL}")
-        print(f"Usage: python {sys.argv[0]} [number_of_domains]")
-        print("Example: python random_3char_domain_check.py 5")
-        sys.exit(1)
+def main():
+    """Command-line entry point"""
+    parser, args = _parse_args()
     
-    check_3char_domains(count)
-    print(f"\n{Fore.YELLOW}--- Check Complete ---{Style.RESET_ALL}") 
\ No newline at end of file
+    # Only loaded once the command line has parsed (see the note at the top)
+    global domaintest
+    import domaintest
+    
+    registrar = args.registrar and _registrar_name(args.registrar)
+    if args.registrar and not registrar:
+        parser.error(f"argument --registrar: choose from {', '.join(domaintest.REGISTRARS)}")
+    
+    check_3char_domains(args.count, args.concurrency, args.use_cache, args.open_choice, registrar)
+    print(f"\n{domaintest.YELLOW}--- Check Complete ---{domaintest.RESET}")
+
+if __name__ == "__main__":
+    main()